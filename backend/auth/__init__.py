@@ -1,6 +1,7 @@
 """Authentication module."""
 
 from .auth import (
+    create_auth_client,
     get_auth_client,
     get_google_oauth_url,
     exchange_code_for_session,
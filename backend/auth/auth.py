@@ -1,25 +1,93 @@
 """Authentication using Supabase Auth with Google OAuth."""
 
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
-from supabase import create_client, Client
-
 from core.config import settings
 from models.schemas import AuthState, User
 
+if TYPE_CHECKING:
+    from supabase import Client
+
+logger = logging.getLogger(__name__)
+
+# Validated users keyed by a hash of their access token, so repeated checks of
+# the same token within the TTL skip the Supabase round trip
+USER_CACHE_TTL_SECONDS = 60
+USER_CACHE_MAX_SIZE = 4096
+
+_user_cache: "OrderedDict[bytes, tuple[float, User]]" = OrderedDict()
+_user_cache_lock = threading.Lock()
+
+
+@lru_cache(maxsize=8192)
+def _uuid(value: str) -> UUID:
+    """Parse a user ID, reusing the result for IDs seen before."""
+    return UUID(value)
+
+
+def _token_key(access_token: str) -> bytes:
+    """Hash an access token so raw tokens are not kept in memory."""
+    return hashlib.sha256(access_token.encode()).digest()
+
+
+def _get_cached_user(key: bytes) -> Optional[User]:
+    """Return a cached user for a token key if it has not expired."""
+    with _user_cache_lock:
+        entry = _user_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, user = entry
+        if expires_at <= time.monotonic():
+            del _user_cache[key]
+            return None
+        return user
+
+
+def _cache_user(key: bytes, user: User) -> None:
+    """Cache a validated user, evicting the oldest entry when full."""
+    with _user_cache_lock:
+        _user_cache[key] = (time.monotonic() + USER_CACHE_TTL_SECONDS, user)
+        _user_cache.move_to_end(key)
+        if len(_user_cache) > USER_CACHE_MAX_SIZE:
+            _user_cache.popitem(last=False)
 
-def get_auth_client() -> Optional[Client]:
-    """Get Supabase client for authentication."""
+
+def create_auth_client() -> Optional["Client"]:
+    """
+    Create a new Supabase client for a call that changes session state.
+
+    Sign-in, code exchange and refresh store the session (and PKCE verifier)
+    on the client itself, so each caller needs its own.
+    """
     if not settings.supabase_configured:
         return None
+    # Imported here so modules that never talk to Supabase skip the client stack
+    from supabase import create_client
     return create_client(settings.supabase_url, settings.supabase_anon_key)
 
 
+@lru_cache(maxsize=1)
+def get_auth_client() -> Optional["Client"]:
+    """
+    Get the shared Supabase client for stateless calls.
+
+    Only use it for calls that take the caller's token explicitly (get_user,
+    admin sign-out); never for calls that store a session on the client.
+    """
+    return create_auth_client()
+
+
 def get_google_oauth_url(redirect_url: str) -> Optional[str]:
     """Get the Google OAuth URL for sign-in."""
-    client = get_auth_client()
+    client = create_auth_client()
     if not client:
         return None
 
@@ -30,13 +98,13 @@ def get_google_oauth_url(redirect_url: str) -> Optional[str]:
         })
         return response.url if response else None
     except Exception as e:
-        print(f"Error getting OAuth URL: {e}")
+        logger.warning("Error getting OAuth URL: %s", e)
         return None
 
 
 def exchange_code_for_session(code: str) -> Optional[AuthState]:
     """Exchange an OAuth code for a session."""
-    client = get_auth_client()
+    client = create_auth_client()
     if not client:
         return None
 
@@ -45,7 +113,7 @@ def exchange_code_for_session(code: str) -> Optional[AuthState]:
 
         if response and response.user:
             user = User(
-                id=UUID(response.user.id),
+                id=_uuid(response.user.id),
                 email=response.user.email,
                 created_at=response.user.created_at or datetime.utcnow(),
                 last_sign_in_at=response.user.last_sign_in_at,
@@ -57,7 +125,7 @@ def exchange_code_for_session(code: str) -> Optional[AuthState]:
             )
         return None
     except Exception as e:
-        print(f"Error exchanging code for session: {e}")
+        logger.warning("Error exchanging code for session: %s", e)
         return None
 
 
@@ -67,25 +135,32 @@ def get_current_user(access_token: str) -> Optional[User]:
     if not client:
         return None
 
+    key = _token_key(access_token)
+    cached = _get_cached_user(key)
+    if cached is not None:
+        return cached
+
     try:
         response = client.auth.get_user(access_token)
 
         if response and response.user:
-            return User(
-                id=UUID(response.user.id),
+            user = User(
+                id=_uuid(response.user.id),
                 email=response.user.email,
                 created_at=response.user.created_at or datetime.utcnow(),
                 last_sign_in_at=response.user.last_sign_in_at,
             )
+            _cache_user(key, user)
+            return user
         return None
     except Exception as e:
-        print(f"Error getting current user: {e}")
+        logger.warning("Error getting current user: %s", e)
         return None
 
 
 def refresh_session(refresh_token: str) -> Optional[AuthState]:
     """Refresh an expired session."""
-    client = get_auth_client()
+    client = create_auth_client()
     if not client:
         return None
 
@@ -94,7 +169,7 @@ def refresh_session(refresh_token: str) -> Optional[AuthState]:
 
         if response and response.user:
             user = User(
-                id=UUID(response.user.id),
+                id=_uuid(response.user.id),
                 email=response.user.email,
                 created_at=response.user.created_at or datetime.utcnow(),
                 last_sign_in_at=response.user.last_sign_in_at,
@@ -106,7 +181,7 @@ def refresh_session(refresh_token: str) -> Optional[AuthState]:
             )
         return None
     except Exception as e:
-        print(f"Error refreshing session: {e}")
+        logger.warning("Error refreshing session: %s", e)
         return None
 
 
@@ -116,11 +191,16 @@ def sign_out(access_token: str) -> bool:
     if not client:
         return False
 
+    with _user_cache_lock:
+        _user_cache.pop(_token_key(access_token), None)
+
     try:
-        client.auth.sign_out()
+        # Revoke the caller's own session by token; the shared client holds
+        # no session of its own
+        client.auth.admin.sign_out(access_token)
         return True
     except Exception as e:
-        print(f"Error signing out: {e}")
+        logger.warning("Error signing out: %s", e)
         return False
 
 
@@ -0,0 +1 @@
+"""Pytest configuration: lets tests import backend modules (main, services, ...) directly."""
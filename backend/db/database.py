@@ -1,11 +1,10 @@
 """Database operations using Supabase."""
 
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
 from uuid import UUID
 
-from supabase import create_client, Client
-
 from core.config import settings
 from models.schemas import (
     Analysis,
@@ -23,21 +22,68 @@ from models.schemas import (
     VideoUpdate,
 )
 
+if TYPE_CHECKING:
+    from supabase import Client
+
 
-def get_supabase_client() -> Optional[Client]:
-    """Get Supabase client if configured."""
+@lru_cache(maxsize=1)
+def get_supabase_client() -> Optional["Client"]:
+    """Get the shared Supabase client if configured."""
     if not settings.supabase_configured:
         return None
+    # Imported here so modules that never talk to Supabase skip the client stack
+    from supabase import create_client
     return create_client(settings.supabase_url, settings.supabase_anon_key)
 
 
-def get_service_client() -> Optional[Client]:
-    """Get Supabase client with service role (admin) permissions."""
+@lru_cache(maxsize=1)
+def get_service_client() -> Optional["Client"]:
+    """Get the shared Supabase client with service role (admin) permissions."""
     if not settings.supabase_configured or not settings.supabase_service_role_key:
         return None
+    # Imported here so modules that never talk to Supabase skip the client stack
+    from supabase import create_client
     return create_client(settings.supabase_url, settings.supabase_service_role_key)
 
 
+# =============================================================================
+# Row Conversion
+# =============================================================================
+
+# Value -> member maps so row conversion is a dict lookup, not an enum call
+_VIDEO_STATUS = {status.value: status for status in VideoStatus}
+_ANALYSIS_STATUS = {status.value: status for status in AnalysisStatus}
+
+
+def _row_to_video(row: dict) -> Video:
+    """Build a Video from a videos table row."""
+    return Video(
+        id=UUID(row["id"]),
+        user_id=UUID(row["user_id"]),
+        filename=row["filename"],
+        r2_key=row["r2_key"],
+        file_size=row["file_size"],
+        duration=row.get("duration"),
+        created_at=datetime.fromisoformat(row["created_at"]),
+        status=_VIDEO_STATUS[row["status"]],
+    )
+
+
+def _row_to_analysis(row: dict) -> Analysis:
+    """Build an Analysis from an analyses table row."""
+    timestamps = [Timestamp.model_validate(ts) for ts in (row.get("timestamps") or [])]
+    return Analysis(
+        id=UUID(row["id"]),
+        video_id=UUID(row["video_id"]),
+        user_id=UUID(row["user_id"]),
+        query=row["query"],
+        timestamps=timestamps,
+        output_r2_key=row.get("output_r2_key"),
+        created_at=datetime.fromisoformat(row["created_at"]),
+        status=_ANALYSIS_STATUS[row["status"]],
+    )
+
+
 # =============================================================================
 # User Settings Operations
 # =============================================================================
@@ -100,17 +146,7 @@ def create_video(video_data: VideoCreate) -> Video:
         "status": VideoStatus.UPLOADING.value,
     }).execute()
 
-    row = result.data[0]
-    return Video(
-        id=UUID(row["id"]),
-        user_id=UUID(row["user_id"]),
-        filename=row["filename"],
-        r2_key=row["r2_key"],
-        file_size=row["file_size"],
-        duration=row.get("duration"),
-        created_at=datetime.fromisoformat(row["created_at"]),
-        status=VideoStatus(row["status"]),
-    )
+    return _row_to_video(result.data[0])
 
 
 def get_video(video_id: UUID) -> Optional[Video]:
@@ -122,17 +158,7 @@ def get_video(video_id: UUID) -> Optional[Video]:
     result = client.table("videos").select("*").eq("id", str(video_id)).execute()
 
     if result.data:
-        row = result.data[0]
-        return Video(
-            id=UUID(row["id"]),
-            user_id=UUID(row["user_id"]),
-            filename=row["filename"],
-            r2_key=row["r2_key"],
-            file_size=row["file_size"],
-            duration=row.get("duration"),
-            created_at=datetime.fromisoformat(row["created_at"]),
-            status=VideoStatus(row["status"]),
-        )
+        return _row_to_video(result.data[0])
     return None
 
 
@@ -151,19 +177,7 @@ def get_user_videos(user_id: UUID, limit: int = 50) -> list[Video]:
         .execute()
     )
 
-    return [
-        Video(
-            id=UUID(row["id"]),
-            user_id=UUID(row["user_id"]),
-            filename=row["filename"],
-            r2_key=row["r2_key"],
-            file_size=row["file_size"],
-            duration=row.get("duration"),
-            created_at=datetime.fromisoformat(row["created_at"]),
-            status=VideoStatus(row["status"]),
-        )
-        for row in result.data
-    ]
+    return [_row_to_video(row) for row in result.data]
 
 
 # =============================================================================
@@ -184,17 +198,7 @@ def create_analysis(analysis_data: AnalysisCreate) -> Analysis:
         "status": AnalysisStatus.PENDING.value,
     }).execute()
 
-    row = result.data[0]
-    return Analysis(
-        id=UUID(row["id"]),
-        video_id=UUID(row["video_id"]),
-        user_id=UUID(row["user_id"]),
-        query=row["query"],
-        timestamps=[],
-        output_r2_key=row.get("output_r2_key"),
-        created_at=datetime.fromisoformat(row["created_at"]),
-        status=AnalysisStatus(row["status"]),
-    )
+    return _row_to_analysis(result.data[0])
 
 
 def get_analysis(analysis_id: UUID) -> Optional[Analysis]:
@@ -206,47 +210,63 @@ def get_analysis(analysis_id: UUID) -> Optional[Analysis]:
     result = client.table("analyses").select("*").eq("id", str(analysis_id)).execute()
 
     if result.data:
-        row = result.data[0]
-        timestamps = [Timestamp(**ts) for ts in (row.get("timestamps") or [])]
-        return Analysis(
-            id=UUID(row["id"]),
-            video_id=UUID(row["video_id"]),
-            user_id=UUID(row["user_id"]),
-            query=row["query"],
-            timestamps=timestamps,
-            output_r2_key=row.get("output_r2_key"),
-            created_at=datetime.fromisoformat(row["created_at"]),
-            status=AnalysisStatus(row["status"]),
-        )
+        return _row_to_analysis(result.data[0])
     return None
 
 
-def get_user_history(user_id: UUID, limit: int = 50) -> list[HistoryItem]:
-    """Get analysis history for a user with video info."""
+def get_user_history(
+    user_id: UUID,
+    limit: int = 50,
+    before: Optional[tuple[datetime, UUID]] = None,
+) -> tuple[list[HistoryItem], Optional[tuple[datetime, UUID]]]:
+    """
+    Get one page of analysis history for a user with video info.
+
+    Pages are keyset-paginated on (created_at, id), newest first: pass the
+    cursor returned with the previous page as `before` to fetch the next
+    (older) page. The id tiebreak keeps rows that share a created_at from
+    being skipped at a page boundary. Relies on an index on analyses
+    (user_id, created_at desc, id desc).
+
+    Returns:
+        Tuple of (items, cursor for the next page or None on the last page)
+    """
     client = get_supabase_client()
     if not client:
-        return []
+        return [], None
 
-    result = (
+    query = (
         client.table("analyses")
         .select("id, query, timestamps, status, created_at, videos(filename)")
         .eq("user_id", str(user_id))
+    )
+    if before is not None:
+        created_at, last_id = before
+        created_at = created_at.isoformat()
+        query = query.or_(
+            f'created_at.lt."{created_at}",'
+            f'and(created_at.eq."{created_at}",id.lt.{last_id})'
+        )
+
+    result = (
+        query
         .order("created_at", desc=True)
+        .order("id", desc=True)
         .limit(limit)
         .execute()
     )
 
-    history = []
-    for row in result.data:
-        video_info = row.get("videos", {})
-        timestamps = row.get("timestamps") or []
-        history.append(HistoryItem(
+    items = [
+        HistoryItem(
             id=UUID(row["id"]),
-            video_filename=video_info.get("filename", "Unknown"),
+            video_filename=(row.get("videos") or {}).get("filename", "Unknown"),
             query=row["query"],
-            clips_found=len(timestamps),
-            status=AnalysisStatus(row["status"]),
+            clips_found=len(row.get("timestamps") or []),
+            status=_ANALYSIS_STATUS[row["status"]],
             created_at=datetime.fromisoformat(row["created_at"]),
-        ))
+        )
+        for row in result.data
+    ]
 
-    return history
+    cursor = (items[-1].created_at, items[-1].id) if len(items) == limit else None
+    return items, cursor
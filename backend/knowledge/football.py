@@ -586,32 +586,26 @@ Runs that attack outside the offensive tackles (C gap and beyond)
 # COMBINED KNOWLEDGE PROMPT
 # =============================================================================
 
-FOOTBALL_KNOWLEDGE = f"""
+KNOWLEDGE_HEADER = """
 # COMPREHENSIVE FOOTBALL KNOWLEDGE BASE
 
 This knowledge base provides detailed definitions and visual identifiers
-for analyzing football video footage.
-
-{OFFENSIVE_POSITIONS}
-
-{DEFENSIVE_POSITIONS}
-
-{ROUTE_TREE}
-
-{RUN_VS_PASS}
-
-{BLOCKING_SCHEMES}
-
-{TACKLE_IDENTIFICATION}
-
-{FIELD_POSITION}
-
-{SACK_IDENTIFICATION}
-
-{TURNOVER_IDENTIFICATION}
-
-{INSIDE_VS_OUTSIDE_RUN}
-"""
+for analyzing football video footage."""
+
+# Joined once at import; every caller shares this one string
+FOOTBALL_KNOWLEDGE = "\n\n".join([
+    KNOWLEDGE_HEADER,
+    OFFENSIVE_POSITIONS,
+    DEFENSIVE_POSITIONS,
+    ROUTE_TREE,
+    RUN_VS_PASS,
+    BLOCKING_SCHEMES,
+    TACKLE_IDENTIFICATION,
+    FIELD_POSITION,
+    SACK_IDENTIFICATION,
+    TURNOVER_IDENTIFICATION,
+    INSIDE_VS_OUTSIDE_RUN,
+]) + "\n"
 
 
 def get_full_knowledge_prompt() -> str:
@@ -1,25 +1,62 @@
 """FastAPI backend for Clip Cutter."""
 
+import atexit
+import json
+import logging
+import logging.handlers
 import os
+import queue
 import shutil
 import tempfile
+import threading
+import time
 import asyncio
+import hashlib
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Literal, Optional
 from uuid import uuid4
 
 from fastapi import FastAPI, File, UploadFile, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import BaseModel
 from dotenv import load_dotenv
 
+from core.config import settings
 from services.analyzer import analyze_video
 from services.clipper import extract_clips, get_video_info
 
 load_dotenv()
 
-app = FastAPI(title="Clip Cutter API", version="1.0.0")
+# Log records are queued and written to stderr by a listener thread, so an
+# error burst never blocks the event loop on console I/O
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_stream = logging.StreamHandler()
+_log_stream.setFormatter(logging.Formatter("%(levelname)s:     %(name)s - %(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_stream)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+_log_handler = logging.handlers.QueueHandler(_log_queue)
+# The listener's handler applies the real format; this only merges args and
+# any traceback into the message before the record crosses threads
+_log_handler.setFormatter(logging.Formatter("%(message)s"))
+logging.basicConfig(level=logging.INFO, handlers=[_log_handler])
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the idle-job expiry loop for the lifetime of the app."""
+    expiry_task = asyncio.create_task(_expire_idle_jobs())
+    yield
+    expiry_task.cancel()
+
+
+app = FastAPI(title="Clip Cutter API", version="1.0.0", lifespan=lifespan)
 
 # CORS for React frontend
 app.add_middleware(
@@ -30,22 +67,211 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Store for active jobs and their progress
-jobs: dict[str, dict] = {}
+
+@dataclass(slots=True)
+class Job:
+    """In-memory state of an uploaded video and its latest analysis."""
+
+    status: str
+    progress: float
+    message: str
+    file_path: str
+    filename: str
+    duration: float
+    file_size: int
+    result_path: Optional[str] = None
+    timestamps: Optional[list] = None
+    error: Optional[str] = None
+    query: str = ""
+    padding: Optional[float] = None
+    precision: str = "keyframe"
+    cancel_event: Optional[threading.Event] = None
+    # SHA-256 of the uploaded video, used to reuse results across uploads
+    content_hash: str = ""
+    # Monotonic time the job last finished work or was used; drives expiry
+    last_used: float = field(default_factory=time.monotonic)
+    # Replaced on every change; see _notify_job
+    updated: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+# Store for active jobs and their progress, least recently used first: every
+# use goes through _touch_job, so this order always matches Job.last_used
+jobs: dict[str, Job] = {}
 
 # Temp directory for processing
 TEMP_DIR = Path(tempfile.gettempdir()) / "clip_cutter"
 TEMP_DIR.mkdir(exist_ok=True)
 
+# Bytes read from an upload per write to disk
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Smallest progress change (in percent) pushed to progress streams by itself
+MIN_PROGRESS_STEP = 1.0
+
+# Statuses where no background work is using the job's files
+IDLE_STATUSES = ("uploaded", "complete", "cancelled", "error")
+
+# Idle jobs kept on disk for download or re-analysis before the oldest are reclaimed
+MAX_RETAINED_JOBS = int(os.getenv("MAX_RETAINED_JOBS", "20"))
+
+# Idle jobs untouched for this long are reclaimed even below the cap
+JOB_TTL_SECONDS = int(os.getenv("JOB_TTL_SECONDS", "3600"))
+
+# How often the expiry loop looks for stale jobs
+JOB_EXPIRY_INTERVAL_SECONDS = 60
+
+# Finished analyses remembered for re-uploads of the same video
+MAX_CACHED_RESULTS = 64
+
+# (content hash, normalized query, padding, precision) -> (timestamps,
+# highlights path), least recently used first
+_result_cache: OrderedDict[tuple[str, str, float, str], tuple[list, Optional[str]]] = OrderedDict()
+
+
+def _remove_job_files(job: Job) -> None:
+    """Delete a job's working directory."""
+    shutil.rmtree(Path(job.file_path).parent, ignore_errors=True)
+
+
+def _save_upload(src, file_path: Path) -> str:
+    """
+    Copy an upload to disk in chunks so a multi-GB video is never held in memory.
+
+    Returns:
+        SHA-256 hex digest of the content, hashed as it is written
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "wb") as f:
+        while chunk := src.read(UPLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+            f.write(chunk)
+    return digest.hexdigest()
+
+
+def _highlights_path(job_id: str, job: Job) -> str:
+    """Where a job's highlights video is written."""
+    return os.path.join(os.path.dirname(job.file_path), f"highlights_{job_id}.mp4")
+
+
+def _link_result(cached_path: str, output_path: str) -> bool:
+    """Hard-link a cached highlights file into place; False if it has been deleted."""
+    if cached_path == output_path:
+        return os.path.exists(output_path)
+    # Link under a temporary name and swap it in, so the new entry never
+    # shares an inode with a stale file and a failed link leaves the job's
+    # previous result untouched
+    partial_path = f"{output_path}.partial"
+    _unlink_missing_ok(partial_path)
+    try:
+        os.link(cached_path, partial_path)
+    except FileNotFoundError:
+        return False
+    except OSError:
+        # Filesystem without hard links
+        try:
+            shutil.copyfile(cached_path, partial_path)
+        except FileNotFoundError:
+            return False
+    os.replace(partial_path, output_path)
+    return True
+
+
+def _unlink_missing_ok(path: str) -> None:
+    """Delete a file if it exists."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _cache_result(job: Job) -> None:
+    """Remember a finished analysis for later uploads of the same video."""
+    if not job.content_hash:
+        return
+    key = (job.content_hash, _normalize_query(job.query), job.padding, job.precision)
+    _result_cache[key] = (job.timestamps, job.result_path)
+    _result_cache.move_to_end(key)
+    if len(_result_cache) > MAX_CACHED_RESULTS:
+        _result_cache.popitem(last=False)
+
+
+def _forget_results(path: str) -> dict:
+    """Drop cached analyses whose highlights file is about to be replaced; returns them."""
+    forgotten = {key: entry for key, entry in _result_cache.items() if entry[1] == path}
+    for key in forgotten:
+        del _result_cache[key]
+    return forgotten
+
+
+def _notify_job(job: Job) -> None:
+    """
+    Wake everything waiting on a job's state. Must run on the event loop.
+
+    Each notification swaps in a fresh event, so a listener that grabbed the
+    old one before sending cannot miss a change that lands while it sends.
+    """
+    updated = job.updated
+    job.updated = asyncio.Event()
+    updated.set()
+
+
+def _touch_job(job_id: str, job: Job) -> None:
+    """Mark a job as just used: stamp last_used and move it to the end of jobs."""
+    job.last_used = time.monotonic()
+    # A job deleted while its work finished must not be registered again
+    if jobs.get(job_id) is job:
+        jobs[job_id] = jobs.pop(job_id)
+
+
+async def _drop_jobs(job_ids: list[str]) -> None:
+    """Unregister jobs and delete their files."""
+    # Unregister every job before awaiting so the set can't change under us
+    dropped = [jobs.pop(job_id) for job_id in job_ids]
+    for job in dropped:
+        _notify_job(job)
+        await asyncio.to_thread(_remove_job_files, job)
+
+
+async def _evict_idle_jobs() -> None:
+    """Drop the least recently used idle jobs beyond MAX_RETAINED_JOBS."""
+    idle = [job_id for job_id, job in jobs.items() if job.status in IDLE_STATUSES]
+    await _drop_jobs(idle[:max(0, len(idle) - MAX_RETAINED_JOBS)])
+
+
+async def _expire_idle_jobs() -> None:
+    """Periodically drop idle jobs unused for longer than JOB_TTL_SECONDS."""
+    while True:
+        await asyncio.sleep(JOB_EXPIRY_INTERVAL_SECONDS)
+        cutoff = time.monotonic() - JOB_TTL_SECONDS
+        # jobs is ordered by last_used (see _touch_job), so the first job used
+        # after the cutoff ends the stale prefix
+        expired = []
+        for job_id, job in jobs.items():
+            if job.last_used >= cutoff:
+                break
+            if job.status in IDLE_STATUSES:
+                expired.append(job_id)
+        await _drop_jobs(expired)
+
+
+@atexit.register
+def _cleanup_all_jobs() -> None:
+    """Remove every job directory on shutdown since job state is in memory only."""
+    for job in list(jobs.values()):
+        _remove_job_files(job)
+
 
 class AnalyzeRequest(BaseModel):
     query: str
     padding: float = 2.0
+    # "keyframe" stream-copies (fast, cuts snap to keyframes); "accurate"
+    # re-encodes so cuts land exactly on the padded timestamps
+    precision: Literal["keyframe", "accurate"] = "keyframe"
 
 
 class JobStatus(BaseModel):
     job_id: str
-    status: str  # pending, uploading, analyzing, extracting, complete, error
+    status: str  # pending, uploading, analyzing, extracting, complete, cancelled, error
     progress: float  # 0-100
     message: str
     result_url: Optional[str] = None
@@ -53,6 +279,11 @@ class JobStatus(BaseModel):
     error: Optional[str] = None
 
 
+def _normalize_query(query: str) -> str:
+    """Normalize a query for comparing repeated analysis requests."""
+    return " ".join(query.lower().split())
+
+
 @app.get("/")
 async def root():
     return {"message": "Clip Cutter API", "version": "1.0.0"}
@@ -74,32 +305,30 @@ async def upload_video(file: UploadFile = File(...)):
     job_dir = TEMP_DIR / job_id
     job_dir.mkdir(exist_ok=True)
 
-    # Save uploaded file
+    # Save uploaded file; disk I/O and ffprobe run in worker threads so the
+    # event loop keeps serving progress updates meanwhile
     file_path = job_dir / file.filename
-    with open(file_path, "wb") as f:
-        content = await file.read()
-        f.write(content)
+    content_hash = await asyncio.to_thread(_save_upload, file.file, file_path)
 
     # Get video info
     try:
-        info = get_video_info(str(file_path))
+        info = await asyncio.to_thread(get_video_info, str(file_path))
     except Exception as e:
-        shutil.rmtree(job_dir, ignore_errors=True)
+        await asyncio.to_thread(shutil.rmtree, job_dir, ignore_errors=True)
         raise HTTPException(status_code=400, detail=f"Invalid video file: {str(e)}")
 
     # Initialize job
-    jobs[job_id] = {
-        "status": "uploaded",
-        "progress": 0,
-        "message": "Video uploaded successfully",
-        "file_path": str(file_path),
-        "filename": file.filename,
-        "duration": info.get("duration", 0),
-        "file_size": info.get("size", 0),
-        "result_path": None,
-        "timestamps": None,
-        "error": None,
-    }
+    jobs[job_id] = Job(
+        status="uploaded",
+        progress=0,
+        message="Video uploaded successfully",
+        file_path=str(file_path),
+        filename=file.filename,
+        duration=info.get("duration", 0),
+        file_size=info.get("size", 0),
+        content_hash=content_hash,
+    )
+    await _evict_idle_jobs()
 
     return {
         "job_id": job_id,
@@ -116,22 +345,94 @@ async def analyze(job_id: str, request: AnalyzeRequest):
         raise HTTPException(status_code=404, detail="Job not found")
 
     job = jobs[job_id]
-    if job["status"] not in ["uploaded", "complete", "error"]:
+    if job.status not in IDLE_STATUSES:
         raise HTTPException(status_code=400, detail="Job is already processing")
 
+    # Mark as most recently used so eviction keeps it
+    _touch_job(job_id, job)
+
+    query = request.query
+    if not query or query.isspace():
+        raise HTTPException(status_code=400, detail="Please enter a search query")
+
+    # The same query on the same video would redo all the Gemini and ffmpeg
+    # work for an identical result, so reuse the previous run
+    if (
+        job.status == "complete"
+        and _normalize_query(job.query) == _normalize_query(request.query)
+        and job.padding == request.padding
+        and job.precision == request.precision
+    ):
+        result_exists = (
+            job.result_path is None
+            or await asyncio.to_thread(os.path.exists, job.result_path)
+        )
+        # Another request may have started work on the job during the check
+        if job.status not in IDLE_STATUSES:
+            raise HTTPException(status_code=400, detail="Job is already processing")
+        if result_exists:
+            return {"job_id": job_id, "status": "complete"}
+
+    # The same video uploaded again (possibly under another job) with the same
+    # query can reuse that analysis and its highlights file
+    cache_key = (job.content_hash, _normalize_query(query), request.padding, request.precision)
+    cached = _result_cache.get(cache_key)
+    if cached is not None:
+        timestamps, cached_path = cached
+        output_path = _highlights_path(job_id, job)
+        linked = True
+        if cached_path is not None:
+            # This job's highlights file is about to be replaced, so entries
+            # pointing at it would serve the new content. They are dropped
+            # before the link so no concurrent lookup can use them mid-swap,
+            # and put back if the link fails and the old file stays
+            forgotten = _forget_results(output_path) if cached_path != output_path else {}
+            # Claim the job while the link runs so a concurrent analyze
+            # request sees it busy instead of starting process_video
+            previous_status, previous_message = job.status, job.message
+            job.status = "analyzing"
+            job.message = "Reusing previous analysis..."
+            linked = False
+            try:
+                linked = await asyncio.to_thread(_link_result, cached_path, output_path)
+            finally:
+                job.status, job.message = previous_status, previous_message
+                if not linked:
+                    _result_cache.update(forgotten)
+            if jobs.get(job_id) is not job:
+                raise HTTPException(status_code=404, detail="Job not found")
+        if linked:
+            if cache_key in _result_cache:
+                _result_cache.move_to_end(cache_key)
+            job.status = "complete"
+            job.progress = 100
+            job.message = f"Reused previous analysis: {len(timestamps)} clips"
+            job.error = None
+            job.timestamps = timestamps
+            job.result_path = output_path if cached_path is not None else None
+            job.query = query
+            job.padding = request.padding
+            job.precision = request.precision
+            _notify_job(job)
+            return {"job_id": job_id, "status": "complete"}
+        _result_cache.pop(cache_key, None)
+
     # Check API key
     if not os.getenv("GOOGLE_API_KEY"):
         raise HTTPException(status_code=500, detail="GOOGLE_API_KEY not configured")
 
     # Reset job state for re-analysis
-    job["status"] = "analyzing"
-    job["progress"] = 0
-    job["message"] = "Starting analysis..."
-    job["error"] = None
-    job["timestamps"] = None
-    job["result_path"] = None
-    job["query"] = request.query
-    job["padding"] = request.padding
+    job.status = "analyzing"
+    job.progress = 0
+    job.message = "Starting analysis..."
+    job.error = None
+    job.timestamps = None
+    job.result_path = None
+    job.query = request.query
+    job.padding = request.padding
+    job.precision = request.precision
+    job.cancel_event = threading.Event()
+    _notify_job(job)
 
     # Start processing in background
     asyncio.create_task(process_video(job_id))
@@ -142,67 +443,91 @@ async def analyze(job_id: str, request: AnalyzeRequest):
 async def process_video(job_id: str):
     """Process video in background."""
     job = jobs[job_id]
-    video_path = job["file_path"]
-    query = job["query"]
-    padding = job["padding"]
+    video_path = job.file_path
+    query = job.query
+    padding = job.padding
+    precision = job.precision
+    cancel_event = job.cancel_event
+    loop = asyncio.get_running_loop()
 
     try:
-        # Progress callback for analysis
+        # Progress callback for analysis (runs in a worker thread)
         def analysis_progress(pct: float, msg: str):
-            job["progress"] = pct * 60  # Analysis is 0-60%
-            job["message"] = msg
-
-        # Run analysis in thread pool to not block
-        loop = asyncio.get_event_loop()
-        timestamps = await loop.run_in_executor(
-            None,
-            lambda: analyze_video(video_path, query, progress_callback=analysis_progress)
+            job.progress = pct * 60  # Analysis is 0-60%
+            job.message = msg
+            loop.call_soon_threadsafe(_notify_job, job)
+
+        # Run blocking analysis in a worker thread so the event loop stays free
+        timestamps = await asyncio.to_thread(
+            analyze_video, video_path, query,
+            progress_callback=analysis_progress, cancel_event=cancel_event,
         )
 
+        if cancel_event.is_set():
+            raise InterruptedError("Cancelled by user")
+
         if not timestamps:
-            job["status"] = "complete"
-            job["progress"] = 100
-            job["message"] = "No matching clips found"
-            job["timestamps"] = []
+            job.status = "complete"
+            job.progress = 100
+            job.message = "No matching clips found"
+            job.timestamps = []
+            _cache_result(job)
             return
 
-        job["timestamps"] = timestamps
-        job["status"] = "extracting"
-        job["message"] = f"Found {len(timestamps)} clips. Extracting..."
+        job.timestamps = timestamps
+        job.status = "extracting"
+        job.message = f"Found {len(timestamps)} clips. Extracting..."
+        _notify_job(job)
 
-        # Progress callback for extraction
+        # Progress callback for extraction (runs in a worker thread)
         def clip_progress(pct: float, msg: str):
-            job["progress"] = 60 + pct * 40  # Extraction is 60-100%
-            job["message"] = msg
-
-        # Create output path
-        job_dir = Path(video_path).parent
-        output_path = job_dir / f"highlights_{job_id}.mp4"
+            if cancel_event.is_set():
+                raise InterruptedError("Cancelled by user")
+            job.progress = 60 + pct * 40  # Extraction is 60-100%
+            job.message = msg
+            loop.call_soon_threadsafe(_notify_job, job)
+
+        # Create output path; drop any previous result first so ffmpeg writes a
+        # new file instead of truncating one that may be hard-linked elsewhere
+        output_path = _highlights_path(job_id, job)
+        _forget_results(output_path)
+        await asyncio.to_thread(_unlink_missing_ok, output_path)
 
         # Extract clips
-        await loop.run_in_executor(
-            None,
-            lambda: extract_clips(
-                video_path,
-                timestamps,
-                output_path=str(output_path),
-                padding=padding,
-                progress_callback=clip_progress,
-            )
+        await asyncio.to_thread(
+            extract_clips,
+            video_path,
+            timestamps,
+            output_path=output_path,
+            padding=padding,
+            progress_callback=clip_progress,
+            precision=precision,
         )
 
-        job["status"] = "complete"
-        job["progress"] = 100
-        job["message"] = f"Successfully extracted {len(timestamps)} clips"
-        job["result_path"] = str(output_path)
+        job.status = "complete"
+        job.progress = 100
+        job.message = f"Successfully extracted {len(timestamps)} clips"
+        job.result_path = output_path
+        _cache_result(job)
+
+    except InterruptedError:
+        job.status = "cancelled"
+        job.message = "Cancelled by user"
 
     except Exception as e:
-        job["status"] = "error"
-        job["error"] = str(e)
-        job["message"] = f"Error: {str(e)}"
-        print(f"Error processing job {job_id}: {e}")
-        import traceback
-        traceback.print_exc()
+        job.status = "error"
+        job.error = str(e)
+        job.message = f"Error: {str(e)}"
+        # Formatting a traceback reads source files from disk; only pay for
+        # it when debugging
+        if settings.debug:
+            logger.exception("Error processing job %s", job_id)
+        else:
+            logger.error("Error processing job %s: %s", job_id, e)
+
+    finally:
+        _touch_job(job_id, job)
+        _notify_job(job)
 
 
 @app.get("/api/status/{job_id}")
@@ -214,12 +539,12 @@ async def get_status(job_id: str):
     job = jobs[job_id]
     return JobStatus(
         job_id=job_id,
-        status=job["status"],
-        progress=job["progress"],
-        message=job["message"],
-        result_url=f"/api/download/{job_id}" if job.get("result_path") else None,
-        timestamps=job.get("timestamps"),
-        error=job.get("error"),
+        status=job.status,
+        progress=job.progress,
+        message=job.message,
+        result_url=f"/api/download/{job_id}" if job.result_path else None,
+        timestamps=job.timestamps,
+        error=job.error,
     )
 
 
@@ -230,16 +555,41 @@ async def download_result(job_id: str):
         raise HTTPException(status_code=404, detail="Job not found")
 
     job = jobs[job_id]
-    if not job.get("result_path") or not os.path.exists(job["result_path"]):
+    if not job.result_path:
+        raise HTTPException(status_code=404, detail="Result not available")
+
+    # One stat both checks the file exists and is handed to FileResponse so
+    # Starlette doesn't stat it again
+    try:
+        stat_result = await asyncio.to_thread(os.stat, job.result_path)
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Result not available")
 
+    _touch_job(job_id, job)
     return FileResponse(
-        job["result_path"],
+        job.result_path,
         media_type="video/mp4",
-        filename=f"clips_{job['filename']}",
+        filename=f"clips_{job.filename}",
+        stat_result=stat_result,
     )
 
 
+@app.post("/api/cancel/{job_id}")
+async def cancel_job(job_id: str):
+    """Cancel a running analysis for this job only."""
+    if job_id not in jobs:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    # A finished or idle job keeps its last cancel_event; setting it would
+    # report a cancel that stopped nothing
+    job = jobs[job_id]
+    if job.status in IDLE_STATUSES or job.cancel_event is None:
+        return {"job_id": job_id, "cancelled": False}
+
+    job.cancel_event.set()
+    return {"job_id": job_id, "cancelled": True}
+
+
 @app.delete("/api/job/{job_id}")
 async def delete_job(job_id: str):
     """Delete a job and its files."""
@@ -248,19 +598,82 @@ async def delete_job(job_id: str):
 
     job = jobs[job_id]
 
-    # Delete job directory
-    job_dir = Path(job["file_path"]).parent
-    shutil.rmtree(job_dir, ignore_errors=True)
+    # Stop any analysis still running against these files
+    if job.cancel_event:
+        job.cancel_event.set()
 
-    # Remove from jobs dict
+    # Remove from jobs dict before the slow delete so nothing else picks it up
     del jobs[job_id]
+    _notify_job(job)
+
+    # Delete job directory
+    await asyncio.to_thread(_remove_job_files, job)
 
     return {"success": True}
 
 
+async def _job_updates(job_id: str) -> AsyncIterator[dict]:
+    """
+    Yield a job's progress until it finishes or is deleted.
+
+    The first update carries the full job state; later updates carry only the
+    fields that changed since the previous one.
+    """
+    sent: dict = {}
+    while True:
+        job = jobs.get(job_id)
+        if not job:
+            yield {"error": "Job deleted"}
+            return
+
+        # Grab the event before yielding so changes made meanwhile still wake us
+        updated = job.updated
+        state = {
+            "status": job.status,
+            "progress": job.progress,
+            "message": job.message,
+            "timestamps": job.timestamps,
+            "result_url": f"/api/download/{job_id}" if job.result_path else None,
+            "error": job.error,
+        }
+        delta = {key: value for key, value in state.items() if key not in sent or sent[key] != value}
+
+        # A sub-percent progress tick on its own isn't worth a message
+        if delta.keys() == {"progress"} and abs(delta["progress"] - sent["progress"]) < MIN_PROGRESS_STEP:
+            delta = {}
+
+        if delta:
+            yield delta
+            sent.update(delta)
+
+        # Check if complete
+        if job.status in ["complete", "cancelled", "error"]:
+            return
+
+        # Sleep until the job changes instead of polling on a timer
+        await updated.wait()
+
+
+@app.get("/api/events/{job_id}")
+async def job_events(job_id: str):
+    """Server-Sent Events stream of progress updates, for use with EventSource."""
+    if job_id not in jobs:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    async def stream():
+        async for update in _job_updates(job_id):
+            yield f"data: {json.dumps(update)}\n\n"
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
 @app.websocket("/ws/{job_id}")
 async def websocket_progress(websocket: WebSocket, job_id: str):
-    """WebSocket for real-time progress updates."""
+    """WebSocket for real-time progress updates (same messages as /api/events)."""
     await websocket.accept()
 
     if job_id not in jobs:
@@ -269,30 +682,8 @@ async def websocket_progress(websocket: WebSocket, job_id: str):
         return
 
     try:
-        last_progress = -1
-        while True:
-            job = jobs.get(job_id)
-            if not job:
-                await websocket.send_json({"error": "Job deleted"})
-                break
-
-            # Send update if progress changed
-            if job["progress"] != last_progress:
-                last_progress = job["progress"]
-                await websocket.send_json({
-                    "status": job["status"],
-                    "progress": job["progress"],
-                    "message": job["message"],
-                    "timestamps": job.get("timestamps"),
-                    "result_url": f"/api/download/{job_id}" if job.get("result_path") else None,
-                    "error": job.get("error"),
-                })
-
-            # Check if complete
-            if job["status"] in ["complete", "error"]:
-                break
-
-            await asyncio.sleep(0.5)
+        async for update in _job_updates(job_id):
+            await websocket.send_json(update)
 
     except WebSocketDisconnect:
         pass
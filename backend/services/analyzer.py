@@ -26,24 +26,34 @@ specific plays in football film. Key features:
    false positives.
 """
 
+import atexit
 import json
+import logging
+import math
 import os
+import re
 import shutil
 import tempfile
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Optional, Callable, Iterator
 
 import ffmpeg
 from google import genai
 from google.genai import types
 from dotenv import load_dotenv
 
-from .clipper import FFMPEG_PATH, FFPROBE_PATH
+from .clipper import FFMPEG_PATH, _probe
 from knowledge import get_full_knowledge_prompt
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Load comprehensive football knowledge base
 # See backend/knowledge/football.py for full definitions
 FOOTBALL_KNOWLEDGE_BASE = get_full_knowledge_prompt()
@@ -64,6 +74,20 @@ MIN_CONFIDENCE_SCORE = 70
 # Enable/disable verification stage (set False to speed up testing)
 ENABLE_VERIFICATION = True
 
+# RAM-backed directory used for temporary segments when it has enough room
+SEGMENT_TMPFS_DIR = "/dev/shm"
+
+# Clips closer than this (seconds) are treated as the same play when merging
+CLIP_MERGE_GAP_SECONDS = 0.5
+
+# Number of segments analyzed concurrently (bounded by Gemini rate limits)
+MAX_CONCURRENT_SEGMENTS = int(os.getenv("GEMINI_CONCURRENCY", "4"))
+
+# Segments cut but not yet analyzed per job: one queued behind the workers.
+# Uploaded segments are deleted, so a job's temp storage peaks at this many
+# segments plus the one being cut
+MAX_BUFFERED_SEGMENTS = MAX_CONCURRENT_SEGMENTS + 1
+
 # =============================================================================
 # SYSTEM INSTRUCTIONS FOR EXPERT FOOTBALL FILM ANALYSIS
 # =============================================================================
@@ -98,18 +122,8 @@ of positions, plays, routes, blocking, tackles, and field position.
 # PROMPT TEMPLATES
 # =============================================================================
 
-def get_detection_prompt(query: str) -> str:
-    """
-    Multi-stage analysis prompt using chain-of-thought reasoning.
-
-    This prompt forces Gemini to:
-    1. First identify camera angles throughout the video
-    2. Only analyze sideline footage
-    3. Detect the target event with strict criteria
-    4. Expand timestamps to capture complete plays
-    5. Assign confidence scores
-    """
-    return f"""Analyze this football video using the following multi-stage process.
+# Built once at import; get_detection_prompt() only substitutes the query
+DETECTION_PROMPT_TEMPLATE = """Analyze this football video using the following multi-stage process.
 
 ## YOUR TASK
 Find every instance where: {query}
@@ -178,6 +192,20 @@ CRITICAL RULES:
 Return ONLY the JSON array, no other text."""
 
 
+def get_detection_prompt(query: str) -> str:
+    """
+    Multi-stage analysis prompt using chain-of-thought reasoning.
+
+    This prompt forces Gemini to:
+    1. First identify camera angles throughout the video
+    2. Only analyze sideline footage
+    3. Detect the target event with strict criteria
+    4. Expand timestamps to capture complete plays
+    5. Assign confidence scores
+    """
+    return DETECTION_PROMPT_TEMPLATE.format(query=query)
+
+
 def get_verification_prompt(query: str, clip_info: dict) -> str:
     """
     Verification prompt for second-stage confirmation.
@@ -241,8 +269,11 @@ def get_generation_config() -> types.GenerateContentConfig:
     - temperature=0.2: Low temperature for more deterministic responses
     - top_p=0.8: Nucleus sampling for quality while maintaining consistency
     - top_k=40: Limits token selection for more focused outputs
+    - system_instruction: Expert analyst role, camera-angle rules and the
+      football knowledge base (SYSTEM_INSTRUCTIONS)
     """
     return types.GenerateContentConfig(
+        system_instruction=SYSTEM_INSTRUCTIONS,
         temperature=0.2,
         top_p=0.8,
         top_k=40,
@@ -255,133 +286,255 @@ def get_generation_config() -> types.GenerateContentConfig:
 
 def log_detection(clip: dict, status: str, reason: str = None):
     """Log detection results with clear formatting."""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+
     timestamp = f"{clip.get('start_time', 0):.1f}s - {clip.get('end_time', 0):.1f}s"
     confidence = clip.get('confidence_score', 0)
 
     if status == "ACCEPTED":
-        print(f"  ✓ ACCEPTED: {timestamp} (confidence: {confidence})")
-        print(f"    → {clip.get('play_description', 'No description')}")
+        logger.debug("  ✓ ACCEPTED: %s (confidence: %s)", timestamp, confidence)
+        logger.debug("    → %s", clip.get('play_description', 'No description'))
     elif status == "REJECTED":
-        print(f"  ✗ REJECTED: {timestamp} (confidence: {confidence})")
-        print(f"    → Reason: {reason}")
+        logger.debug("  ✗ REJECTED: %s (confidence: %s)", timestamp, confidence)
+        logger.debug("    → Reason: %s", reason)
     elif status == "FILTERED":
-        print(f"  ⊘ FILTERED: {timestamp}")
-        print(f"    → Reason: {reason}")
+        logger.debug("  ⊘ FILTERED: %s", timestamp)
+        logger.debug("    → Reason: %s", reason)
 
 
 def log_verification_result(clip: dict, verification: dict):
     """Log detailed verification results."""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+
     timestamp = f"{clip.get('start_time', 0):.1f}s - {clip.get('end_time', 0):.1f}s"
 
-    print(f"\n  Verification for {timestamp}:")
-    print(f"    Camera angle: {'✓' if verification.get('camera_angle_verified') else '✗'} - {verification.get('camera_angle_reasoning', 'N/A')}")
-    print(f"    Complete play: {'✓' if verification.get('complete_play_verified') else '✗'} - {verification.get('complete_play_reasoning', 'N/A')}")
-    print(f"    Player ID: {'✓' if verification.get('player_verified') else '✗'} - {verification.get('player_reasoning', 'N/A')}")
-    print(f"    Action match: {'✓' if verification.get('action_verified') else '✗'} - {verification.get('action_reasoning', 'N/A')}")
-    print(f"    → Recommendation: {verification.get('recommendation', 'UNKNOWN')}")
+    logger.debug("  Verification for %s:", timestamp)
+    logger.debug("    Camera angle: %s - %s", '✓' if verification.get('camera_angle_verified') else '✗', verification.get('camera_angle_reasoning', 'N/A'))
+    logger.debug("    Complete play: %s - %s", '✓' if verification.get('complete_play_verified') else '✗', verification.get('complete_play_reasoning', 'N/A'))
+    logger.debug("    Player ID: %s - %s", '✓' if verification.get('player_verified') else '✗', verification.get('player_reasoning', 'N/A'))
+    logger.debug("    Action match: %s - %s", '✓' if verification.get('action_verified') else '✗', verification.get('action_reasoning', 'N/A'))
+    logger.debug("    → Recommendation: %s", verification.get('recommendation', 'UNKNOWN'))
 
 
 # =============================================================================
 # CORE ANALYSIS FUNCTIONS
 # =============================================================================
 
+# Bounds concurrent upload + analysis work across all jobs in the process
+_gemini_slots = threading.BoundedSemaphore(MAX_CONCURRENT_SEGMENTS)
+
+# Cleanup work (Gemini file deletes, temp dir removal) runs here so it stays
+# off the critical path; pending jobs are drained at interpreter exit
+_cleanup_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cleanup")
+atexit.register(_cleanup_pool.shutdown, wait=True)
+
+
+def _delete_uploaded_file(client: genai.Client, name: str):
+    """Delete an uploaded Gemini file, logging instead of raising on failure."""
+    try:
+        client.files.delete(name=name)
+        logger.debug("Cleaned up uploaded video file: %s", name)
+    except Exception as e:
+        logger.warning("Could not delete uploaded file %s: %s", name, e)
+
+
+def delete_uploaded_file(client: genai.Client, name: str):
+    """Schedule deletion of an uploaded Gemini file without waiting for it."""
+    _cleanup_pool.submit(_delete_uploaded_file, client, name)
+
+
+def _remove_temp_dir(temp_dir: str, tmpfs_bytes: float = 0):
+    """
+    Remove a temp directory, logging instead of raising on failure.
+
+    tmpfs_bytes is the tmpfs reservation the directory held, released once
+    its files are gone.
+    """
+    try:
+        shutil.rmtree(temp_dir)
+    except Exception as e:
+        logger.warning("Could not clean up temp directory: %s", e)
+    finally:
+        if tmpfs_bytes:
+            release_segment_temp_root(tmpfs_bytes)
+
+
 def get_client() -> genai.Client:
-    """Create and return a Gemini client."""
+    """Return the shared Gemini client, creating it on first use."""
     api_key = os.getenv("GOOGLE_API_KEY")
     if not api_key:
         raise ValueError("GOOGLE_API_KEY environment variable not set")
+    return _create_client(api_key)
+
+
+@lru_cache(maxsize=1)
+def _create_client(api_key: str) -> genai.Client:
+    """Create one client per API key so its connection pool is reused."""
     return genai.Client(api_key=api_key)
 
 
 def get_video_duration_and_size(video_path: str) -> tuple[float, int]:
     """Get video duration in seconds and file size in bytes."""
-    probe = ffmpeg.probe(video_path, cmd=FFPROBE_PATH)
-    duration = float(probe["format"]["duration"])
-    size = int(probe["format"]["size"])
-    return duration, size
+    # Shares the clipper's cached ffprobe run, so a video probed at upload is
+    # not probed again here
+    probe_format = _probe(video_path)["format"]
+    return float(probe_format["duration"]), int(probe_format["size"])
 
 
-def split_video_into_segments(video_path: str, segment_duration: float, temp_dir: str,
-                               progress_callback=None, cancel_event=None) -> list[tuple[str, float]]:
+# tmpfs bytes promised to segment windows of jobs still running; a free-space
+# check alone would let concurrent jobs each pass it and together fill tmpfs
+_tmpfs_reserved = 0
+_tmpfs_lock = threading.Lock()
+
+
+def get_segment_temp_root(required_bytes: float) -> Optional[str]:
     """
-    Split a video into segments of specified duration.
+    Pick where to write temporary segments.
 
-    Returns:
-        List of tuples (segment_path, start_offset_seconds)
+    Segments are written once and read straight back by the Gemini upload, so
+    a tmpfs like /dev/shm avoids the disk round trip entirely. The room is
+    reserved against other jobs; hand it back with
+    release_segment_temp_root() once the segments are gone. Falls back to the
+    default temp dir (None) when tmpfs is missing or too small.
+    """
+    global _tmpfs_reserved
+
+    if not os.path.isdir(SEGMENT_TMPFS_DIR):
+        return None
+    with _tmpfs_lock:
+        try:
+            free = shutil.disk_usage(SEGMENT_TMPFS_DIR).free
+        except OSError:
+            return None
+        if free - _tmpfs_reserved > required_bytes * 1.2:
+            _tmpfs_reserved += required_bytes
+            return SEGMENT_TMPFS_DIR
+    return None
+
+
+def release_segment_temp_root(required_bytes: float):
+    """Return tmpfs room reserved by get_segment_temp_root()."""
+    global _tmpfs_reserved
+
+    with _tmpfs_lock:
+        _tmpfs_reserved -= required_bytes
+
+
+def split_video_into_segments(video_path: str, total_duration: float,
+                               segment_duration: float, temp_dir: str,
+                               progress_callback=None, cancel_event=None) -> Iterator[tuple[str, float]]:
     """
-    probe = ffmpeg.probe(video_path, cmd=FFPROBE_PATH)
-    total_duration = float(probe["format"]["duration"])
+    Split a video into segments of specified duration.
 
-    segments = []
-    current_start = 0.0
-    segment_index = 0
+    Each segment is cut with its own stream-copy ffmpeg run, and only when the
+    caller asks for the next one, so a consumer that falls behind pauses the
+    split instead of letting the whole video pile up in temp storage. ffmpeg's
+    -progress output drives progress updates (the fraction of the video cut so
+    far) and lets a cancel stop ffmpeg mid-segment.
+
+    Yields:
+        Tuples of (segment_path, start_offset_seconds)
+    """
+    num_segments = math.ceil(total_duration / segment_duration)
 
-    while current_start < total_duration:
+    for segment_index in range(num_segments):
         if cancel_event and cancel_event.is_set():
             raise InterruptedError("Cancelled by user")
 
-        segment_path = os.path.join(temp_dir, f"segment_{segment_index:03d}.mp4")
-        segment_end = min(current_start + segment_duration, total_duration)
-        actual_duration = segment_end - current_start
+        segment_start = segment_index * segment_duration
+        segment_length = min(segment_duration, total_duration - segment_start)
 
-        if progress_callback:
-            pct = current_start / total_duration
-            progress_callback(0.02 + pct * 0.08, f"Splitting video: segment {segment_index + 1}...")
+        # Don't pay a full upload + Gemini round trip for an empty tail
+        if segment_length < 0.01:
+            logger.debug("Skipping empty segment %d: %.3fs", segment_index, segment_length)
+            continue
 
-        print(f"Creating segment {segment_index}: {current_start:.1f}s - {segment_end:.1f}s")
+        segment_path = os.path.join(temp_dir, f"segment_{segment_index:03d}.mp4")
 
-        # Extract segment using ffmpeg
-        (
+        # Seeking on the input jumps straight to the nearest keyframe instead
+        # of reading the file from the start for every segment
+        process = (
             ffmpeg
-            .input(video_path, ss=current_start, t=actual_duration)
-            .output(
-                segment_path,
-                c="copy",
-                avoid_negative_ts="make_zero",
-            )
+            .input(video_path, ss=segment_start, t=segment_length, fflags="+genpts")
+            .output(segment_path, c="copy", avoid_negative_ts="make_zero")
+            .global_args("-loglevel", "error", "-nostats", "-progress", "pipe:2")
             .overwrite_output()
-            .run(cmd=FFMPEG_PATH, quiet=True)
+            .run_async(cmd=FFMPEG_PATH, pipe_stderr=True)
         )
 
-        segments.append((segment_path, current_start))
-        current_start = segment_end
-        segment_index += 1
+        error_lines = []
+        try:
+            for raw_line in process.stderr:
+                if cancel_event and cancel_event.is_set():
+                    process.terminate()
+
+                line = raw_line.decode(errors="replace").strip()
+                key, sep, value = line.partition("=")
+                if not sep or " " in key:
+                    error_lines.append(line)
+                    continue
+
+                # out_time_ms is reported in microseconds despite its name
+                if key == "out_time_ms" and progress_callback:
+                    try:
+                        pct = min((segment_start + int(value) / 1_000_000) / total_duration, 1.0)
+                    except ValueError:
+                        continue
+                    progress_callback(pct, f"Splitting video... {pct:.0%}")
+
+            process.wait()
+
+        finally:
+            # Stop ffmpeg if we bail out early (cancel, error in a callback)
+            if process.poll() is None:
+                process.kill()
+                process.wait()
 
-    return segments
+        if cancel_event and cancel_event.is_set():
+            raise InterruptedError("Cancelled by user")
+        if process.returncode != 0:
+            raise ffmpeg.Error(FFMPEG_PATH, None, "\n".join(error_lines).encode())
+
+        logger.debug("Created segment %d: %.1fs - %.1fs", segment_index, segment_start, segment_start + segment_length)
+        yield segment_path, segment_start
 
 
 def upload_video(client: genai.Client, video_path: str, progress_callback=None, cancel_event=None) -> types.File:
     """Upload a video file to Gemini and wait for processing."""
-    print(f"Uploading video: {video_path}")
+    logger.debug("Uploading video: %s", video_path)
 
     # Check for cancellation before starting
     if cancel_event and cancel_event.is_set():
         raise InterruptedError("Cancelled by user")
 
     video_file = client.files.upload(file=video_path)
-    print(f"Upload started: {video_file.name}")
+    logger.debug("Upload started: %s", video_file.name)
 
-    # Wait for video processing to complete
+    # Wait for video processing to complete, backing off from 0.5s up to 10s
     poll_count = 0
+    poll_delay = 0.5
     while video_file.state == types.FileState.PROCESSING:
         # Check for cancellation
         if cancel_event and cancel_event.is_set():
-            print("Upload cancelled, cleaning up...")
-            try:
-                client.files.delete(name=video_file.name)
-            except:
-                pass
+            logger.info("Upload cancelled, cleaning up...")
+            delete_uploaded_file(client, video_file.name)
             raise InterruptedError("Cancelled by user")
 
         poll_count += 1
-        print(f"Processing video... (attempt {poll_count})")
-        time.sleep(3)
+        logger.debug("Processing video... (attempt %d)", poll_count)
+        if cancel_event:
+            cancel_event.wait(poll_delay)
+        else:
+            time.sleep(poll_delay)
+        poll_delay = min(poll_delay * 1.5, 10.0)
         video_file = client.files.get(name=video_file.name)
 
     if video_file.state == types.FileState.FAILED:
         raise ValueError(f"Video processing failed: {video_file.name}")
 
-    print(f"Video ready: {video_file.name}")
+    logger.debug("Video ready: %s", video_file.name)
     return video_file
 
 
@@ -421,7 +574,7 @@ def call_gemini_with_retry(client: genai.Client, video_file: types.File, prompt:
             error_str = str(e)
             if "429" in error_str or "RESOURCE_EXHAUSTED" in error_str:
                 if attempt < max_retries - 1:
-                    print(f"Rate limited, waiting {retry_delay}s before retry {attempt + 2}/{max_retries}...")
+                    logger.warning("Rate limited, waiting %ds before retry %d/%d...", retry_delay, attempt + 2, max_retries)
                     # Wait with cancellation check
                     for _ in range(retry_delay):
                         if cancel_event and cancel_event.is_set():
@@ -436,25 +589,66 @@ def call_gemini_with_retry(client: genai.Client, video_file: types.File, prompt:
     return ""
 
 
+# Matches a ```json ... ``` (or bare ```) fenced block in a Gemini response
+JSON_FENCE_PATTERN = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+
+
 def parse_json_response(response_text: str) -> list | dict | None:
     """
     Parse JSON from Gemini response, handling markdown code blocks.
     """
     try:
         # Handle case where response might have markdown code blocks
-        if "```json" in response_text:
-            response_text = response_text.split("```json")[1].split("```")[0].strip()
-        elif "```" in response_text:
-            response_text = response_text.split("```")[1].split("```")[0].strip()
+        match = JSON_FENCE_PATTERN.search(response_text)
+        if match:
+            response_text = match.group(1)
 
         return json.loads(response_text)
 
     except json.JSONDecodeError as e:
-        print(f"Failed to parse JSON response: {e}")
-        print(f"Response was: {response_text[:500]}...")
+        # Gemini sometimes wraps the array in prose; retry on the outermost
+        # brackets, located with find/rfind so the scan stays linear
+        start = response_text.find("[")
+        end = response_text.rfind("]")
+        if start != -1 and end > start:
+            try:
+                return json.loads(response_text[start:end + 1])
+            except json.JSONDecodeError:
+                pass
+
+        logger.warning("Failed to parse JSON response: %s", e)
+        logger.debug("Response was: %s...", response_text[:500])
         return None
 
 
+def normalize_detections(detections: list) -> list[dict]:
+    """
+    Drop malformed detections and coerce numeric fields in a single pass.
+
+    Gemini occasionally returns non-object items, missing times or numbers as
+    strings. Anything without usable start/end times is discarded so later
+    stages can rely on float start_time/end_time values.
+    """
+    normalized = []
+
+    for item in detections:
+        if not isinstance(item, dict):
+            continue
+        try:
+            item['start_time'] = float(item['start_time'])
+            item['end_time'] = float(item['end_time'])
+        except (KeyError, TypeError, ValueError):
+            logger.debug("Dropping malformed detection: %s", item)
+            continue
+        try:
+            item['confidence_score'] = float(item.get('confidence_score', 0))
+        except (TypeError, ValueError):
+            item['confidence_score'] = 0
+        normalized.append(item)
+
+    return normalized
+
+
 def filter_by_confidence_and_angle(detections: list[dict]) -> tuple[list[dict], list[dict]]:
     """
     Filter detections by confidence score and camera angle.
@@ -509,7 +703,7 @@ def verify_clip(client: genai.Client, video_file: types.File, query: str,
         return verification
 
     except Exception as e:
-        print(f"Verification error: {e}")
+        logger.warning("Verification error: %s", e)
         return {
             'all_criteria_met': False,
             'recommendation': 'REJECT',
@@ -519,7 +713,7 @@ def verify_clip(client: genai.Client, video_file: types.File, query: str,
 
 def analyze_single_segment(client: genai.Client, video_path: str, query: str,
                            time_offset: float = 0.0, cancel_event=None,
-                           progress_callback=None) -> list[dict]:
+                           progress_callback=None, delete_after_upload: bool = False) -> list[dict]:
     """
     Analyze a single video segment with multi-stage detection and verification.
 
@@ -529,58 +723,79 @@ def analyze_single_segment(client: genai.Client, video_path: str, query: str,
     3. Filter by confidence score and camera angle
     4. (Optional) Verify each detection with second Gemini call
     5. Return verified detections adjusted by time offset
+
+    At most MAX_CONCURRENT_SEGMENTS segments are in flight across all jobs, so
+    the number of files sitting in Gemini storage stays bounded. Set
+    delete_after_upload for temporary segment files so the local copy is
+    removed as soon as Gemini has it; together with the split backpressure in
+    analyze_video, a job holds at most MAX_BUFFERED_SEGMENTS + 1 segments in
+    temp storage.
     """
-    print(f"\n{'='*60}")
-    print(f"ANALYZING SEGMENT (offset: {time_offset:.1f}s)")
-    print(f"{'='*60}")
+    with _gemini_slots:
+        return _analyze_single_segment(
+            client, video_path, query, time_offset,
+            cancel_event=cancel_event,
+            delete_after_upload=delete_after_upload,
+        )
+
+
+def _analyze_single_segment(client: genai.Client, video_path: str, query: str,
+                            time_offset: float, cancel_event=None,
+                            delete_after_upload: bool = False) -> list[dict]:
+    """Run the analysis pipeline for one segment (see analyze_single_segment)."""
+    logger.debug("ANALYZING SEGMENT (offset: %.1fs)", time_offset)
 
     if cancel_event and cancel_event.is_set():
         raise InterruptedError("Cancelled by user")
 
     # Stage 1: Upload video
-    print("\n[Stage 1] Uploading video to Gemini...")
+    logger.debug("[Stage 1] Uploading video to Gemini...")
     video_file = upload_video(client, video_path, cancel_event=cancel_event)
 
-    if cancel_event and cancel_event.is_set():
+    if delete_after_upload:
         try:
-            client.files.delete(name=video_file.name)
-        except:
-            pass
+            os.unlink(video_path)
+        except OSError as e:
+            logger.warning("Could not delete segment %s: %s", video_path, e)
+
+    if cancel_event and cancel_event.is_set():
+        delete_uploaded_file(client, video_file.name)
         return []
 
     try:
         # Stage 2: Run detection with chain-of-thought prompt
-        print("\n[Stage 2] Running multi-stage detection analysis...")
+        logger.debug("[Stage 2] Running multi-stage detection analysis...")
         detection_prompt = get_detection_prompt(query)
         response_text = call_gemini_with_retry(client, video_file, detection_prompt, cancel_event)
 
         detections = parse_json_response(response_text)
 
         if detections is None or not isinstance(detections, list):
-            print("No valid detections returned")
+            logger.debug("No valid detections returned")
             return []
 
-        print(f"\nInitial detections: {len(detections)} clips found")
+        detections = normalize_detections(detections)
+        logger.debug("Initial detections: %d clips found", len(detections))
 
         # Stage 3: Filter by confidence and camera angle
-        print("\n[Stage 3] Filtering by confidence and camera angle...")
+        logger.debug("[Stage 3] Filtering by confidence and camera angle...")
         accepted, rejected = filter_by_confidence_and_angle(detections)
 
-        print(f"After filtering: {len(accepted)} accepted, {len(rejected)} rejected")
+        logger.debug("After filtering: %d accepted, %d rejected", len(accepted), len(rejected))
 
         if not accepted:
             return []
 
         # Stage 4: Verification (optional)
         if ENABLE_VERIFICATION:
-            print("\n[Stage 4] Running verification on accepted clips...")
+            logger.debug("[Stage 4] Running verification on accepted clips...")
             verified_clips = []
 
             for i, clip in enumerate(accepted):
                 if cancel_event and cancel_event.is_set():
                     break
 
-                print(f"\nVerifying clip {i+1}/{len(accepted)}...")
+                logger.debug("Verifying clip %d/%d...", i + 1, len(accepted))
                 verification = verify_clip(client, video_file, query, clip, cancel_event)
 
                 log_verification_result(clip, verification)
@@ -597,7 +812,7 @@ def analyze_single_segment(client: genai.Client, video_path: str, query: str,
                     log_detection(clip, "REJECTED", verification.get('rejection_reason'))
 
             accepted = verified_clips
-            print(f"\nAfter verification: {len(accepted)} clips confirmed")
+            logger.debug("After verification: %d clips confirmed", len(accepted))
         else:
             # Mark as unverified but accepted
             for clip in accepted:
@@ -606,18 +821,40 @@ def analyze_single_segment(client: genai.Client, video_path: str, query: str,
 
         # Adjust timestamps by offset
         for clip in accepted:
-            clip['start_time'] = float(clip['start_time']) + time_offset
-            clip['end_time'] = float(clip['end_time']) + time_offset
+            clip['start_time'] += time_offset
+            clip['end_time'] += time_offset
 
         return accepted
 
     finally:
-        # Clean up the uploaded file
-        try:
-            client.files.delete(name=video_file.name)
-            print("Cleaned up uploaded video file")
-        except Exception as e:
-            print(f"Warning: Could not delete uploaded file: {e}")
+        # Clean up the uploaded file in the background
+        delete_uploaded_file(client, video_file.name)
+
+
+def merge_overlapping_clips(clips: list[dict], max_gap: float = CLIP_MERGE_GAP_SECONDS) -> list[dict]:
+    """
+    Merge clips that overlap or sit within max_gap seconds of each other.
+
+    Expects clips sorted by start_time. Runs in a single linear pass; merged
+    clips keep the first clip's fields, the widest time range, the highest
+    confidence and both play descriptions.
+    """
+    merged = []
+
+    for clip in clips:
+        if merged and clip["start_time"] <= merged[-1]["end_time"] + max_gap:
+            prev = merged[-1]
+            prev["end_time"] = max(prev["end_time"], clip["end_time"])
+            prev["confidence_score"] = max(prev.get("confidence_score", 0), clip.get("confidence_score", 0))
+
+            description = clip.get("play_description")
+            if description and description != prev.get("play_description"):
+                prev["play_description"] = "; ".join(filter(None, [prev.get("play_description"), description]))
+            continue
+
+        merged.append(clip)
+
+    return merged
 
 
 def analyze_video(video_path: str, query: str, progress_callback=None, cancel_event=None) -> list[dict]:
@@ -647,19 +884,17 @@ def analyze_video(video_path: str, query: str, progress_callback=None, cancel_ev
         - action_type: Type of action (catch, run, etc.)
         - verification_status: "verified", "skipped", or "rejected"
     """
-    print(f"\n{'#'*60}")
-    print(f"FOOTBALL VIDEO ANALYZER")
-    print(f"{'#'*60}")
-    print(f"Query: {query}")
-    print(f"Video: {video_path}")
-    print(f"Verification: {'ENABLED' if ENABLE_VERIFICATION else 'DISABLED'}")
-    print(f"Min confidence: {MIN_CONFIDENCE_SCORE}")
+    logger.info("Analyzing %s for query: %s", video_path, query)
+    logger.debug(
+        "Verification: %s, min confidence: %d",
+        "ENABLED" if ENABLE_VERIFICATION else "DISABLED", MIN_CONFIDENCE_SCORE,
+    )
 
     client = get_client()
 
     # Get video info
     duration, file_size = get_video_duration_and_size(video_path)
-    print(f"Duration: {duration:.1f}s, Size: {file_size / (1024**2):.1f}MB")
+    logger.debug("Duration: %.1fs, Size: %.1fMB", duration, file_size / (1024**2))
 
     # Check if we need to segment
     if file_size <= MAX_FILE_SIZE_BYTES:
@@ -681,89 +916,120 @@ def analyze_video(video_path: str, query: str, progress_callback=None, cancel_ev
         return results
 
     # Need to segment the video
-    print(f"\nVideo is {file_size / (1024**3):.2f}GB, segmenting for processing...")
+    logger.info("Video is %.2fGB, segmenting for processing...", file_size / (1024**3))
 
     # Calculate segment duration based on file size and target
     segment_duration = (TARGET_SEGMENT_SIZE_BYTES / file_size) * duration
     segment_duration = max(60, min(600, segment_duration))
 
-    num_segments = int(duration / segment_duration) + 1
-    print(f"Will create ~{num_segments} segments of ~{segment_duration:.0f}s each")
+    num_segments = math.ceil(duration / segment_duration)
+    logger.debug("Will create ~%d segments of ~%.0fs each", num_segments, segment_duration)
 
     if progress_callback:
         progress_callback(0.02, f"Splitting video into {num_segments} segments...")
 
-    # Create temp directory for segments
-    temp_dir = tempfile.mkdtemp(prefix="video_segments_")
+    # Create temp directory for segments, in RAM when there's room for the
+    # most segments the pipeline keeps at once (see MAX_BUFFERED_SEGMENTS)
+    segment_bytes = file_size * segment_duration / duration
+    window_bytes = min(file_size, (MAX_BUFFERED_SEGMENTS + 1) * segment_bytes)
+    temp_root = get_segment_temp_root(window_bytes)
+    temp_dir = tempfile.mkdtemp(prefix="video_segments_", dir=temp_root)
 
     try:
-        # Split video
-        segments = split_video_into_segments(
-            video_path, segment_duration, temp_dir,
-            progress_callback=progress_callback, cancel_event=cancel_event
-        )
-
-        if cancel_event and cancel_event.is_set():
-            return []
-
-        # Analyze each segment
+        # Split and analyze as a pipeline: each segment is handed to the pool
+        # as soon as ffmpeg finishes cutting it, so uploads overlap the split.
+        # Each analysis is dominated by upload and Gemini latency, so running
+        # them concurrently gives a near-linear speedup.
         all_clips = []
-        total_segments = len(segments)
+        completed = 0
+
+        def split_progress(pct: float, message: str):
+            # Once segments start finishing, their progress takes over
+            if progress_callback and not completed:
+                progress_callback(0.02 + pct * 0.08, message)
+
+        def collect(done):
+            nonlocal completed
+            for future in done:
+                segment_clips = future.result()
+                all_clips.extend(segment_clips)
+                completed += 1
+                logger.debug("Segment %d complete: %d verified clips", futures.pop(future) + 1, len(segment_clips))
+
+                if progress_callback:
+                    progress_callback(
+                        0.1 + (completed / num_segments) * 0.8,
+                        f"Analyzed {completed}/{num_segments} segments...",
+                    )
+
+        executor = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_SEGMENTS)
+        try:
+            futures = {}
+            segments = split_video_into_segments(
+                video_path, duration, segment_duration, temp_dir,
+                progress_callback=split_progress, cancel_event=cancel_event
+            )
+            for i, (segment_path, time_offset) in enumerate(segments):
+                # Backpressure: with the window full, wait for a segment to
+                # finish before cutting more, so the split never runs ahead
+                # of the uploads
+                while len(futures) >= MAX_BUFFERED_SEGMENTS:
+                    done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    collect(done)
+
+                future = executor.submit(
+                    analyze_single_segment,
+                    client, segment_path, query,
+                    time_offset=time_offset,
+                    cancel_event=cancel_event,
+                    delete_after_upload=True,
+                )
+                futures[future] = i
 
-        for i, (segment_path, time_offset) in enumerate(segments):
             if cancel_event and cancel_event.is_set():
                 return []
 
-            if progress_callback:
-                base_progress = 0.1 + (i / total_segments) * 0.8
-                progress_callback(base_progress, f"Analyzing segment {i + 1}/{total_segments}...")
-
-            segment_clips = analyze_single_segment(
-                client, segment_path, query,
-                time_offset=time_offset,
-                cancel_event=cancel_event,
-                progress_callback=progress_callback
-            )
-
-            all_clips.extend(segment_clips)
-            print(f"\nSegment {i + 1} complete: {len(segment_clips)} verified clips")
+            while futures:
+                if cancel_event and cancel_event.is_set():
+                    return []
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                collect(done)
+        finally:
+            # Drop queued segments on cancel/error; running ones see cancel_event
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        # Sort by start time and collapse plays detected on both sides of a
+        # segment boundary
+        all_clips.sort(key=itemgetter("start_time"))
+        all_clips = merge_overlapping_clips(all_clips)
 
         if progress_callback:
             progress_callback(1.0, f"Found {len(all_clips)} total verified clips")
 
-        # Sort by start time
-        all_clips.sort(key=lambda x: x["start_time"])
-
         print_summary(all_clips)
         return all_clips
 
     finally:
-        # Clean up temp directory
-        try:
-            shutil.rmtree(temp_dir)
-        except Exception as e:
-            print(f"Warning: Could not clean up temp directory: {e}")
+        # Clean up temp directory in the background so results return immediately
+        _cleanup_pool.submit(_remove_temp_dir, temp_dir, window_bytes if temp_root else 0)
 
 
 def print_summary(clips: list[dict]):
-    """Print a summary of analysis results."""
-    print(f"\n{'='*60}")
-    print(f"ANALYSIS SUMMARY")
-    print(f"{'='*60}")
-    print(f"Total verified clips: {len(clips)}")
-
-    if clips:
-        print(f"\nVerified clips:")
-        for i, clip in enumerate(clips, 1):
-            print(f"\n  {i}. [{clip['start_time']:.1f}s - {clip['end_time']:.1f}s]")
-            print(f"     Confidence: {clip.get('confidence_score', 'N/A')}")
-            print(f"     Player: {clip.get('player_jersey', 'N/A')}")
-            print(f"     Action: {clip.get('action_type', 'N/A')}")
-            print(f"     Description: {clip.get('play_description', 'N/A')}")
-    else:
-        print("\nNo clips met all verification criteria.")
-
-    print(f"\n{'='*60}\n")
+    """Log a summary of analysis results."""
+    logger.info("Analysis complete: %d verified clips", len(clips))
+
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+
+    for i, clip in enumerate(clips, 1):
+        logger.debug(
+            "  %d. [%.1fs - %.1fs] confidence=%s player=%s action=%s: %s",
+            i, clip['start_time'], clip['end_time'],
+            clip.get('confidence_score', 'N/A'),
+            clip.get('player_jersey', 'N/A'),
+            clip.get('action_type', 'N/A'),
+            clip.get('play_description', 'N/A'),
+        )
 
 
 if __name__ == "__main__":
@@ -774,6 +1040,8 @@ if __name__ == "__main__":
         print("Usage: python analyzer.py <video_path> <query>")
         sys.exit(1)
 
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+
     video_path = sys.argv[1]
     query = sys.argv[2]
 
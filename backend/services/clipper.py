@@ -1,10 +1,14 @@
 """Video clip extraction using FFmpeg."""
 
+import json
+import logging
 import os
-import shutil
+import subprocess
 import tempfile
+import threading
 import ffmpeg
-from pathlib import Path
+from functools import lru_cache
+from typing import Literal
 
 # FFmpeg executable paths - use explicit path on Windows if not in PATH
 FFMPEG_PATH = r"C:\ffmpeg\bin\ffmpeg.exe" if os.name == "nt" else "ffmpeg"
@@ -16,6 +20,218 @@ if not os.path.exists(FFMPEG_PATH):
 if not os.path.exists(FFPROBE_PATH):
     FFPROBE_PATH = "ffprobe"
 
+logger = logging.getLogger(__name__)
+
+# ffprobe fields read by get_video_info and extract_clips
+PROBE_FORMAT_ENTRIES = "duration,size,format_name"
+PROBE_STREAM_ENTRIES = "codec_type,codec_name,width,height,r_frame_rate"
+
+
+def _probe(video_path: str) -> dict:
+    """Get ffprobe output for a video, shared between callers; do not mutate."""
+    stat = os.stat(video_path)
+    return _probe_cached(video_path, stat.st_size, stat.st_mtime_ns)
+
+
+@lru_cache(maxsize=128)
+def _probe_cached(video_path: str, file_size: int, mtime_ns: int) -> dict:
+    """Run ffprobe once per (path, size, mtime) so upload and extract share it."""
+    # Full -show_format -show_streams output is several KB per file; only ask
+    # for the fields we read
+    result = subprocess.run(
+        [FFPROBE_PATH, "-v", "error",
+         "-show_entries", f"format={PROBE_FORMAT_ENTRIES}:stream={PROBE_STREAM_ENTRIES}",
+         "-of", "json", video_path],
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+    )
+    if result.returncode != 0:
+        raise ffmpeg.Error(FFPROBE_PATH, result.stdout, result.stderr)
+    return json.loads(result.stdout)
+
+
+def _merge_intervals(
+    timestamps: list[dict],
+    padding: float,
+    duration: float,
+) -> list[tuple[float, float]]:
+    """
+    Pad and clamp timestamps, then merge any that overlap or touch.
+
+    Overlapping padded clips would otherwise copy the same footage twice and
+    add a seam between them.
+
+    Returns:
+        Sorted list of (start, end) tuples in seconds
+    """
+    merged = []
+    for ts in sorted(timestamps, key=lambda t: t["start_time"]):
+        # Apply padding and clamp to video bounds
+        start = max(0, ts["start_time"] - padding)
+        end = min(duration, ts["end_time"] + padding)
+
+        if end - start <= 0:
+            logger.warning("Skipping invalid clip: %s", ts)
+            continue
+
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+
+    return merged
+
+
+def _concat_path(path: str) -> str:
+    """Quote a path for an ffmpeg concat list."""
+    # FFmpeg concat requires forward slashes and escaped quotes
+    safe_path = path.replace("\\", "/").replace("'", "'\\''")
+    return f"'{safe_path}'"
+
+
+# Encoders tried in order for frame-accurate cuts; hardware first, libx264 as
+# the software fallback that is always expected to work
+ACCURATE_ENCODERS = {
+    "h264_nvenc": ["-preset", "p1"],
+    "h264_qsv": ["-preset", "veryfast"],
+    "h264_videotoolbox": ["-realtime", "1"],
+    "libx264": ["-preset", "ultrafast", "-crf", "23"],
+}
+
+
+@lru_cache(maxsize=1)
+def _available_encoders() -> frozenset[str]:
+    """Names of the encoders this ffmpeg build was compiled with."""
+    result = subprocess.run(
+        [FFMPEG_PATH, "-hide_banner", "-encoders"],
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+    )
+    # Encoder lines look like " V....D h264_nvenc  NVIDIA NVENC H.264 encoder"
+    return frozenset(
+        parts[1] for parts in (line.split() for line in result.stdout.splitlines())
+        if len(parts) >= 2
+    )
+
+
+def _run_ffmpeg(args: list[str], total_seconds: float, progress_callback, message: str):
+    """Run ffmpeg with the given arguments, reporting its -progress output."""
+    process = subprocess.Popen(
+        [FFMPEG_PATH, "-hide_banner", "-loglevel", "error", "-nostdin", "-nostats",
+         *args, "-progress", "pipe:1"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+
+    # Drain stderr on a thread so a chatty ffmpeg can't block on a full pipe
+    error_lines = []
+    stderr_reader = threading.Thread(
+        target=lambda: error_lines.extend(process.stderr), daemon=True
+    )
+    stderr_reader.start()
+
+    total_us = total_seconds * 1_000_000
+    try:
+        # Report progress from this thread so a callback that raises
+        # (e.g. on cancel) stops ffmpeg
+        for line in process.stdout:
+            key, _, value = line.strip().partition("=")
+            if key == "out_time_ms" and value.isdigit() and progress_callback:
+                pct = min(int(value) / total_us, 1.0) if total_us else 0.0
+                progress_callback(pct * 0.95, message)
+
+        process.wait()
+        stderr_reader.join()
+        if process.returncode != 0:
+            raise ffmpeg.Error(FFMPEG_PATH, None, "".join(error_lines).encode())
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+
+
+def _extract_keyframe(
+    video_path: str,
+    clips: list[tuple[float, float]],
+    output_path: str,
+    progress_callback,
+):
+    """Stream-copy clips with the concat demuxer; cuts snap to keyframes."""
+    total_seconds = sum(end - start for start, end in clips)
+
+    # Temp directory for the concat list, removed even if ffmpeg fails
+    with tempfile.TemporaryDirectory(prefix="video_clips_", ignore_cleanup_errors=True) as temp_dir:
+        # Each entry reads one clip's range of the source. With -c copy the
+        # cuts land on keyframes, which the clip padding absorbs.
+        source = _concat_path(video_path)
+        concat_file = os.path.join(temp_dir, "concat.txt")
+        with open(concat_file, "wb") as f:
+            f.write("".join(
+                f"file {source}\ninpoint {start:.3f}\noutpoint {end:.3f}\n"
+                for start, end in clips
+            ).encode("utf-8"))
+
+        _run_ffmpeg(
+            [
+                "-f", "concat", "-safe", "0", "-i", concat_file,
+                "-c", "copy",  # Copy codec for speed (no re-encoding)
+                "-avoid_negative_ts", "make_zero",
+                "-y", output_path,
+            ],
+            total_seconds,
+            progress_callback,
+            f"Extracting {len(clips)} clips...",
+        )
+
+
+def _extract_accurate(
+    video_path: str,
+    clips: list[tuple[float, float]],
+    output_path: str,
+    has_audio: bool,
+    progress_callback,
+):
+    """Re-encode clips so cuts land exactly on the requested frames."""
+    total_seconds = sum(end - start for start, end in clips)
+
+    # One seeked input per clip, joined by the concat filter
+    inputs = []
+    for start, end in clips:
+        inputs += ["-ss", f"{start:.3f}", "-t", f"{end - start:.3f}", "-i", video_path]
+    streams = "".join(
+        f"[{i}:v:0][{i}:a:0]" if has_audio else f"[{i}:v:0]" for i in range(len(clips))
+    )
+    if has_audio:
+        graph = f"{streams}concat=n={len(clips)}:v=1:a=1[v][a]"
+        outputs = ["-map", "[v]", "-map", "[a]", "-c:a", "aac"]
+    else:
+        graph = f"{streams}concat=n={len(clips)}:v=1:a=0[v]"
+        outputs = ["-map", "[v]"]
+
+    available = _available_encoders()
+    encoders = [name for name in ACCURATE_ENCODERS if name in available] or ["libx264"]
+
+    # A hardware encoder can be compiled in but have no device behind it, so
+    # fall back down the list until one succeeds
+    for encoder in encoders:
+        try:
+            _run_ffmpeg(
+                [*inputs, "-filter_complex", graph, *outputs,
+                 "-c:v", encoder, *ACCURATE_ENCODERS[encoder],
+                 "-y", output_path],
+                total_seconds,
+                progress_callback,
+                f"Encoding {len(clips)} clips...",
+            )
+            return
+        except ffmpeg.Error as e:
+            if encoder == encoders[-1]:
+                raise
+            logger.warning("Encoder %s failed, falling back: %s", encoder, e.stderr.decode(errors="replace").strip())
+
 
 def extract_clips(
     video_path: str,
@@ -23,16 +239,23 @@ def extract_clips(
     output_path: str = None,
     padding: float = 2.0,
     progress_callback=None,
+    precision: Literal["keyframe", "accurate"] = "keyframe",
 ) -> str:
     """
     Extract clips from a video based on timestamps and concatenate them.
 
+    By default the clips are stream-copied straight from the source by the
+    concat demuxer in a single ffmpeg pass, so no intermediate clip files are
+    written and cuts snap to the nearest keyframe. "accurate" precision
+    re-encodes instead, preferring a hardware H.264 encoder.
+
     Args:
         video_path: Path to the source video
         timestamps: List of dicts with start_time and end_time (in seconds)
         output_path: Path for the output video (auto-generated if None)
         padding: Seconds to add before/after each clip for context
         progress_callback: Optional callback for progress updates
+        precision: "keyframe" for fast stream copy, "accurate" for exact cuts
 
     Returns:
         Path to the concatenated output video
@@ -40,104 +263,43 @@ def extract_clips(
     if not timestamps:
         raise ValueError("No timestamps provided")
 
-    video_path = Path(video_path)
-    if not video_path.exists():
+    video_path = os.fspath(video_path)
+    if not os.path.exists(video_path):
         raise FileNotFoundError(f"Video not found: {video_path}")
 
     # Get video duration to clamp timestamps
-    probe = ffmpeg.probe(str(video_path), cmd=FFPROBE_PATH)
+    probe = _probe(video_path)
     duration = float(probe["format"]["duration"])
 
     # Generate output path if not provided
     if output_path is None:
-        output_path = video_path.parent / f"{video_path.stem}_clips{video_path.suffix}"
-    output_path = Path(output_path)
-
-    # Create temp directory for individual clips
-    temp_dir = tempfile.mkdtemp(prefix="video_clips_")
-    clip_paths = []
-
-    try:
-        total_clips = len(timestamps)
-
-        for i, ts in enumerate(timestamps):
-            if progress_callback:
-                progress_callback(
-                    (i / total_clips) * 0.8,
-                    f"Extracting clip {i + 1}/{total_clips}..."
-                )
-
-            # Apply padding and clamp to video bounds
-            start = max(0, ts["start_time"] - padding)
-            end = min(duration, ts["end_time"] + padding)
-            clip_duration = end - start
-
-            if clip_duration <= 0:
-                print(f"Skipping invalid clip: {ts}")
-                continue
-
-            clip_path = Path(temp_dir) / f"clip_{i:04d}.mp4"
-            clip_paths.append(clip_path)
-
-            # Extract clip using FFmpeg
-            (
-                ffmpeg
-                .input(str(video_path), ss=start, t=clip_duration)
-                .output(
-                    str(clip_path),
-                    c="copy",  # Copy codec for speed (no re-encoding)
-                    avoid_negative_ts="make_zero",
-                )
-                .overwrite_output()
-                .run(cmd=FFMPEG_PATH, quiet=True)
-            )
+        stem, ext = os.path.splitext(video_path)
+        output_path = f"{stem}_clips{ext}"
+    output_path = os.fspath(output_path)
 
-        if not clip_paths:
-            raise ValueError("No valid clips extracted")
+    clips = _merge_intervals(timestamps, padding, duration)
 
-        if progress_callback:
-            progress_callback(0.85, "Concatenating clips...")
+    if not clips:
+        raise ValueError("No valid clips extracted")
 
-        # Concatenate all clips
-        if len(clip_paths) == 1:
-            # Just copy the single clip
-            import shutil
-            shutil.copy(clip_paths[0], output_path)
-        else:
-            # Create concat file list
-            concat_file = Path(temp_dir) / "concat.txt"
-            with open(concat_file, "w") as f:
-                for clip_path in clip_paths:
-                    # FFmpeg concat requires forward slashes and escaped quotes
-                    safe_path = str(clip_path).replace("\\", "/")
-                    f.write(f"file '{safe_path}'\n")
-
-            # Concatenate using FFmpeg concat demuxer
-            (
-                ffmpeg
-                .input(str(concat_file), format="concat", safe=0)
-                .output(str(output_path), c="copy")
-                .overwrite_output()
-                .run(cmd=FFMPEG_PATH, quiet=True)
-            )
+    if progress_callback:
+        progress_callback(0.0, f"Extracting {len(clips)} clips...")
 
-        if progress_callback:
-            progress_callback(1.0, "Done!")
+    if precision == "accurate":
+        has_audio = any(s["codec_type"] == "audio" for s in probe["streams"])
+        _extract_accurate(video_path, clips, output_path, has_audio, progress_callback)
+    else:
+        _extract_keyframe(video_path, clips, output_path, progress_callback)
 
-        return str(output_path)
+    if progress_callback:
+        progress_callback(1.0, "Done!")
 
-    finally:
-        # Clean up temp files
-        import shutil
-        try:
-            shutil.rmtree(temp_dir)
-        except Exception as e:
-            print(f"Warning: Could not clean up temp directory: {e}")
+    return output_path
 
 
 def get_video_info(video_path: str) -> dict:
     """Get basic information about a video file."""
-    probe = ffmpeg.probe(video_path, cmd=FFPROBE_PATH)
+    probe = _probe(video_path)
 
     video_stream = next(
         (s for s in probe["streams"] if s["codec_type"] == "video"),
@@ -0,0 +1,124 @@
+"""Tests for reusing finished analyses across uploads of the same video."""
+
+import asyncio
+import os
+from collections import OrderedDict
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("google.genai")
+
+import main
+from fastapi import HTTPException
+
+
+@pytest.fixture
+def started_jobs(monkeypatch):
+    """Isolate job state and record process_video calls instead of running them."""
+    monkeypatch.setattr(main, "jobs", {})
+    monkeypatch.setattr(main, "_result_cache", OrderedDict())
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+
+    started = []
+
+    def fake_process_video(job_id: str):
+        started.append(job_id)
+        return asyncio.sleep(0)
+
+    monkeypatch.setattr(main, "process_video", fake_process_video)
+    return started
+
+
+def _upload(tmp_path, job_id: str, content_hash: str = "same-video") -> main.Job:
+    """Register an uploaded job the way upload_video does."""
+    job_dir = tmp_path / job_id
+    job_dir.mkdir()
+    video_path = job_dir / "video.mp4"
+    video_path.write_bytes(b"video")
+    job = main.Job(
+        status="uploaded",
+        progress=0,
+        message="Video uploaded successfully",
+        file_path=str(video_path),
+        filename="video.mp4",
+        duration=60.0,
+        file_size=5,
+        content_hash=content_hash,
+    )
+    main.jobs[job_id] = job
+    return job
+
+
+def _finish(job_id: str, job: main.Job, query: str, highlights: str):
+    """Record a completed analysis the way process_video does."""
+    output_path = main._highlights_path(job_id, job)
+    with open(output_path, "w") as f:
+        f.write(highlights)
+    job.status = "complete"
+    job.query = query
+    job.padding = 2.0
+    job.timestamps = [{"start_time": 0.0, "end_time": 10.0}]
+    job.result_path = output_path
+    main._cache_result(job)
+
+
+def test_cache_hit_forgets_entries_for_replaced_highlights(tmp_path, started_jobs):
+    job_a = _upload(tmp_path, "a")
+    _finish("a", job_a, "Q2", "Q2 highlights")
+    job_b = _upload(tmp_path, "b")
+    _finish("b", job_b, "Q1", "Q1 highlights")
+
+    # Re-running B with Q2 reuses A's result and replaces B's Q1 highlights
+    response = asyncio.run(main.analyze("b", main.AnalyzeRequest(query="Q2")))
+    assert response["status"] == "complete"
+    with open(job_b.result_path) as f:
+        assert f.read() == "Q2 highlights"
+
+    # A new upload asking Q1 must be analyzed, not served B's replaced file
+    _upload(tmp_path, "c")
+    response = asyncio.run(main.analyze("c", main.AnalyzeRequest(query="Q1")))
+    assert response["status"] == "analyzing"
+    assert started_jobs == ["c"]
+
+
+def test_analyze_while_linking_cached_result_is_rejected(tmp_path, started_jobs):
+    job_a = _upload(tmp_path, "a")
+    _finish("a", job_a, "Q1", "Q1 highlights")
+    job_b = _upload(tmp_path, "b")
+
+    async def analyze_twice():
+        return await asyncio.gather(
+            main.analyze("b", main.AnalyzeRequest(query="Q1")),
+            main.analyze("b", main.AnalyzeRequest(query="Q2")),
+            return_exceptions=True,
+        )
+
+    reused, concurrent = asyncio.run(analyze_twice())
+
+    assert reused["status"] == "complete"
+    assert isinstance(concurrent, HTTPException)
+    assert concurrent.status_code == 400
+    assert started_jobs == []
+    assert job_b.status == "complete"
+    assert job_b.query == "Q1"
+
+
+def test_failed_link_keeps_entries_for_existing_highlights(tmp_path, started_jobs):
+    job_a = _upload(tmp_path, "a")
+    _finish("a", job_a, "Q2", "Q2 highlights")
+    job_b = _upload(tmp_path, "b")
+    _finish("b", job_b, "Q1", "Q1 highlights")
+    b_highlights = job_b.result_path
+
+    # A's highlights disappear after being cached, so B's reuse of Q2 fails
+    # and falls back to a fresh analysis
+    os.remove(job_a.result_path)
+    response = asyncio.run(main.analyze("b", main.AnalyzeRequest(query="Q2")))
+    assert response["status"] == "analyzing"
+    assert started_jobs == ["b"]
+
+    # B's Q1 highlights were never replaced, so their cache entry survives
+    with open(b_highlights) as f:
+        assert f.read() == "Q1 highlights"
+    assert any(path == b_highlights for _, path in main._result_cache.values())
@@ -53,6 +53,8 @@ export function useVideoAnalysis(): UseVideoAnalysisReturn {
           if (status.result_url) {
             setResultUrl(api.getDownloadUrl(status.result_url))
           }
+        } else if (status.status === 'cancelled') {
+          setIsProcessing(false)
         } else if (status.status === 'error') {
           setIsProcessing(false)
           setError(status.error || 'Processing failed')
@@ -12,7 +12,7 @@ export interface Timestamp {
 
 export interface JobStatus {
   job_id: string
-  status: 'uploaded' | 'analyzing' | 'extracting' | 'complete' | 'error'
+  status: 'uploaded' | 'analyzing' | 'extracting' | 'complete' | 'cancelled' | 'error'
   progress: number
   message: string
   result_url: string | null